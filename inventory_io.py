@@ -0,0 +1,167 @@
+import datetime
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from itertools import compress
+from operator import itemgetter
+from types import MappingProxyType
+
+# Reading and writing shared by part1 and part2. Each input file is parsed once
+# per process and cached by (absolute path, modification time), so running both
+# parts in one process, or reading a file twice, does not parse it again.
+
+
+# Function to read ManufacturerList.txt
+def read_manufacturer_list(file_path):
+    """
+    Reads the ManufacturerList.txt file and returns a dictionary of items.
+    Each item contains details like ID, manufacturer, type, and damaged status,
+    plus lowercased manufacturer and type for case-insensitive queries. The item
+    details are read-only mappings shared with the parse cache.
+    """
+    return dict(_read_manufacturer_list(*_cache_key(file_path)))
+
+
+# Function to read PriceList.txt
+def read_price_list(file_path):
+    """
+    Reads the PriceList.txt file and returns a dictionary mapping item IDs to prices.
+    """
+    return dict(_read_price_list(*_cache_key(file_path)))
+
+
+# Function to read ServiceDatesList.txt
+def read_service_dates_list(file_path):
+    """
+    Reads the ServiceDatesList.txt file and returns a dictionary mapping item IDs to service dates.
+    """
+    return dict(_read_service_dates_list(*_cache_key(file_path)))
+
+
+# Helper function to build the parse cache key for a file
+def _cache_key(file_path):
+    """
+    Returns (absolute path, modification time) for file_path, so an edited file
+    is parsed again instead of being served from the cache.
+    """
+    return os.path.abspath(file_path), os.stat(file_path).st_mtime_ns
+
+
+# The cached parsers below return shared dictionaries. The public read_*
+# functions hand out shallow copies that callers may add to or remove from;
+# manufacturer rows are read-only mappings, so they can be shared without
+# copying. Only the latest few parses are kept, so older versions of an
+# edited file are dropped.
+@lru_cache(maxsize=3)
+def _read_manufacturer_list(file_path, mtime_ns):
+    """Parse ManufacturerList.txt; cached, callers must not modify the result"""
+    manufacturer_data = {}
+    with open(file_path, 'r') as file:
+        for line in file.read().splitlines():
+            # Split the line by comma and strip whitespace
+            parts = list(map(str.strip, line.split(',')))
+            item_id = parts[0]
+            manufacturer = sys.intern(parts[1])  # Few distinct values; intern so duplicates share one string
+            item_type = sys.intern(parts[2])
+            damaged = parts[3] if len(parts) > 3 else None  # Damaged indicator may be missing
+            manufacturer_data[item_id] = MappingProxyType({
+                'manufacturer': manufacturer,
+                'item_type': item_type,
+                'damaged': damaged,
+                'manufacturer_lc': sys.intern(manufacturer.lower()),
+                'item_type_lc': sys.intern(item_type.lower())
+            })
+    return manufacturer_data
+
+
+@lru_cache(maxsize=3)
+def _read_price_list(file_path, mtime_ns):
+    """Parse PriceList.txt; cached, callers must not modify the result"""
+    with open(file_path, 'r') as file:
+        rows = [line.split(',') for line in file.read().splitlines()]
+    # Convert whole columns at once; float() ignores surrounding whitespace
+    item_ids = map(str.strip, map(itemgetter(0), rows))
+    prices = map(float, map(itemgetter(1), rows))
+    return dict(zip(item_ids, prices))
+
+
+@lru_cache(maxsize=3)
+def _read_service_dates_list(file_path, mtime_ns):
+    """Parse ServiceDatesList.txt; cached, callers must not modify the result"""
+    with open(file_path, 'r') as file:
+        rows = [line.split(',') for line in file.read().splitlines()]
+    item_ids = map(str.strip, map(itemgetter(0), rows))
+    date_strs = list(map(str.strip, map(itemgetter(1), rows)))
+
+    # Parse each distinct date string once; MM/DD/YYYY is split directly since strptime is far slower
+    parsed_dates = {}
+    for date_str in set(date_strs):
+        month, day, year = date_str.split('/')
+        parsed_dates[date_str] = datetime.date(int(year), int(month), int(day))
+    return dict(zip(item_ids, map(parsed_dates.__getitem__, date_strs)))
+
+
+# Service date given to items missing from ServiceDatesList.txt; never past due
+NO_SERVICE_DATE = datetime.date.max
+
+# One row of an inventory report
+InventoryItem = namedtuple('InventoryItem', ['item_id', 'manufacturer', 'item_type', 'price', 'service_date', 'damaged'])
+
+
+# Function to fill in missing prices and service dates
+def fill_missing_data(manufacturer_data, price_data, service_date_data):
+    """
+    Gives every item a price and a service date so the writers can index the
+    dictionaries directly. Missing prices default to 0 and missing service dates
+    to NO_SERVICE_DATE. Run it once after loading; the writers expect complete data.
+    """
+    for item_id in manufacturer_data:
+        price_data.setdefault(item_id, 0)
+        service_date_data.setdefault(item_id, NO_SERVICE_DATE)
+
+
+# Helper function to find items past their service date
+def past_service_item_ids(manufacturer_data, service_date_data, today):
+    """
+    Returns the IDs of items whose service date is before today, sorted by
+    service date (oldest to most recent). Only the date column is touched.
+    """
+    # Boolean mask over the date column
+    service_dates = map(service_date_data.__getitem__, manufacturer_data)
+    past_ids = list(compress(manufacturer_data, map(today.__gt__, service_dates)))
+    past_ids.sort(key=service_date_data.__getitem__)
+    return past_ids
+
+
+# Zero-padded month and day strings, indexed by number (index 0 is unused)
+MONTH_STRS = tuple(f"{month:02d}" for month in range(13))
+DAY_STRS = tuple(f"{day:02d}" for day in range(32))
+
+
+# Helper function to format a service date for the output files
+def format_service_date(service_date):
+    """
+    Formats a service date as MM/DD/YYYY, or an empty field for NO_SERVICE_DATE.
+    The sentinel is checked by identity, so a real 12/31/9999 date read from the
+    input is still written out in full.
+    """
+    if service_date is NO_SERVICE_DATE:
+        return ''
+    return _format_date(service_date)
+
+
+@lru_cache(maxsize=None)
+def _format_date(service_date):
+    """Format a date as MM/DD/YYYY; cached, so each distinct date is formatted once"""
+    return MONTH_STRS[service_date.month] + '/' + DAY_STRS[service_date.day] + '/' + str(service_date.year)
+
+
+# Helper function to write report lines to a file
+def write_report(output_file, lines):
+    """
+    Writes the report lines to output_file. The lines are joined and encoded once
+    and written in binary mode, skipping the text-mode encoding layer.
+    """
+    with open(output_file, 'wb') as file:
+        file.write(''.join(lines).encode())
@@ -1,5 +1,10 @@
 import datetime
 import os
+from collections import defaultdict
+from operator import attrgetter
+
+import inventory_io
+from inventory_io import InventoryItem, format_service_date, write_report
 
 # Inventory Class
 class Inventory:
@@ -8,132 +13,172 @@ class Inventory:
         self.manufacturer_data = {}
         self.price_data = {}
         self.service_date_data = {}
+        self._filled = False  # Whether fill_missing_data has run since the last read
+
+        # Column arrays (one entry per item) scanned by query_inventory
+        self.ids = []
+        self.manufacturers = []
+        self.item_types = []
+        self.manufacturers_lc = []
+        self.item_types_lc = []
+        self.prices = []
+        self.service_dates = []
+        self.damaged = []
+        self._manufacturers_set = frozenset()
+        self._types_set = frozenset()
+        self._by_mfr_type = {}  # (manufacturer_lc, item_type_lc) -> item indices, by price descending
+        self._by_type = {}  # item_type_lc -> item indices
 
     def read_manufacturer_list(self, file_path):
         """Read ManufacturerList.txt and load manufacturer data"""
-        with open(file_path, 'r') as file:
-            for line in file:
-                parts = [part.strip() for part in line.split(',')]
-                item_id = parts[0]
-                manufacturer = parts[1]
-                item_type = parts[2]
-                damaged = parts[3] if len(parts) > 3 else None
-                self.manufacturer_data[item_id] = {
-                    'manufacturer': manufacturer,
-                    'item_type': item_type,
-                    'damaged': damaged
-                }
+        self.manufacturer_data.update(inventory_io.read_manufacturer_list(file_path))
+        self._filled = False
 
     def read_price_list(self, file_path):
         """Read PriceList.txt and load price data"""
-        with open(file_path, 'r') as file:
-            for line in file:
-                parts = [part.strip() for part in line.split(',')]
-                item_id = parts[0]
-                price = float(parts[1])
-                self.price_data[item_id] = price
+        self.price_data.update(inventory_io.read_price_list(file_path))
+        self._filled = False
 
     def read_service_dates_list(self, file_path):
         """Read ServiceDatesList.txt and load service date data"""
-        with open(file_path, 'r') as file:
-            for line in file:
-                parts = [part.strip() for part in line.split(',')]
-                item_id = parts[0]
-                service_date = datetime.datetime.strptime(parts[1], '%m/%d/%Y').date()
-                self.service_date_data[item_id] = service_date
+        self.service_date_data.update(inventory_io.read_service_dates_list(file_path))
+        self._filled = False
+
+    def fill_missing_data(self):
+        """Give every item a price and service date, once per load; writers and queries call this"""
+        if not self._filled:
+            inventory_io.fill_missing_data(self.manufacturer_data, self.price_data, self.service_date_data)
+            self._filled = True
 
     def write_full_inventory(self, output_file):
         """Write FullInventory.txt sorted by manufacturer name"""
+        self.fill_missing_data()
         inventory = []
         for item_id, details in self.manufacturer_data.items():
-            inventory.append({
-                'item_id': item_id,
-                'manufacturer': details['manufacturer'],
-                'item_type': details['item_type'],
-                'price': self.price_data.get(item_id, 0),
-                'service_date': self.service_date_data.get(item_id, None),
-                'damaged': details['damaged']
-            })
-
-        inventory = sorted(inventory, key=lambda x: x['manufacturer'])
-
-        with open(output_file, 'w') as file:
-            for item in inventory:
-                file.write(f"{item['item_id']}, {item['manufacturer']}, {item['item_type']}, "
-                           f"{item['price']}, {item['service_date'].strftime('%m/%d/%Y')}, {item['damaged'] or ''}\n")
+            inventory.append(InventoryItem(
+                item_id,
+                details['manufacturer'],
+                details['item_type'],
+                self.price_data[item_id],
+                self.service_date_data[item_id],
+                details['damaged']
+            ))
+
+        inventory = sorted(inventory, key=attrgetter('manufacturer'))
+
+        lines = [f"{item.item_id}, {item.manufacturer}, {item.item_type}, "
+                 f"{item.price}, {format_service_date(item.service_date)}, {item.damaged or ''}\n"
+                 for item in inventory]
+        write_report(output_file, lines)
 
     def write_item_type_inventories(self, output_dir):
         """Write separate inventory files for each item type"""
-        item_type_groups = {}
+        self.fill_missing_data()
+        item_type_groups = defaultdict(list)
         for item_id, details in self.manufacturer_data.items():
-            item_type = details['item_type']
-            if item_type not in item_type_groups:
-                item_type_groups[item_type] = []
-            item_type_groups[item_type].append({
-                'item_id': item_id,
-                'manufacturer': details['manufacturer'],
-                'price': self.price_data.get(item_id, 0),
-                'service_date': self.service_date_data.get(item_id, None),
-                'damaged': details['damaged']
-            })
+            item_type_groups[details['item_type']].append(InventoryItem(
+                item_id,
+                details['manufacturer'],
+                details['item_type'],
+                self.price_data[item_id],
+                self.service_date_data[item_id],
+                details['damaged']
+            ))
 
         for item_type, items in item_type_groups.items():
-            items = sorted(items, key=lambda x: x['item_id'])
+            items = sorted(items, key=attrgetter('item_id'))
             file_name = os.path.join(output_dir, f"{item_type.capitalize()}Inventory.txt")
-            with open(file_name, 'w') as file:
-                for item in items:
-                    file.write(f"{item['item_id']}, {item['manufacturer']}, {item['price']}, "
-                               f"{item['service_date'].strftime('%m/%d/%Y')}, {item['damaged'] or ''}\n")
+            lines = [f"{item.item_id}, {item.manufacturer}, {item.price}, "
+                     f"{format_service_date(item.service_date)}, {item.damaged or ''}\n"
+                     for item in items]
+            write_report(file_name, lines)
 
     def write_past_service_date_inventory(self, output_file):
         """Write PastServiceDateInventory.txt with expired service dates"""
+        self.fill_missing_data()
         today = datetime.date.today()
         past_service_items = []
 
-        for item_id, details in self.manufacturer_data.items():
-            service_date = self.service_date_data.get(item_id, None)
-            if service_date and service_date < today:
-                past_service_items.append({
-                    'item_id': item_id,
-                    'manufacturer': details['manufacturer'],
-                    'item_type': details['item_type'],
-                    'price': self.price_data.get(item_id, 0),
-                    'service_date': service_date,
-                    'damaged': details['damaged']
-                })
-
-        past_service_items = sorted(past_service_items, key=lambda x: x['service_date'])
-
-        with open(output_file, 'w') as file:
-            for item in past_service_items:
-                file.write(f"{item['item_id']}, {item['manufacturer']}, {item['item_type']}, "
-                           f"{item['price']}, {item['service_date'].strftime('%m/%d/%Y')}, {item['damaged'] or ''}\n")
+        for item_id in inventory_io.past_service_item_ids(self.manufacturer_data, self.service_date_data, today):
+            details = self.manufacturer_data[item_id]
+            past_service_items.append(InventoryItem(
+                item_id,
+                details['manufacturer'],
+                details['item_type'],
+                self.price_data[item_id],
+                self.service_date_data[item_id],
+                details['damaged']
+            ))
+
+        lines = [f"{item.item_id}, {item.manufacturer}, {item.item_type}, "
+                 f"{item.price}, {format_service_date(item.service_date)}, {item.damaged or ''}\n"
+                 for item in past_service_items]
+        write_report(output_file, lines)
 
     def write_damaged_inventory(self, output_file):
         """Write DamagedInventory.txt with all damaged items"""
+        self.fill_missing_data()
         damaged_items = []
 
         for item_id, details in self.manufacturer_data.items():
             if details['damaged']:
-                damaged_items.append({
-                    'item_id': item_id,
-                    'manufacturer': details['manufacturer'],
-                    'item_type': details['item_type'],
-                    'price': self.price_data.get(item_id, 0),
-                    'service_date': self.service_date_data.get(item_id, None)
-                })
-
-        damaged_items = sorted(damaged_items, key=lambda x: -x['price'])
-
-        with open(output_file, 'w') as file:
-            for item in damaged_items:
-                file.write(f"{item['item_id']}, {item['manufacturer']}, {item['item_type']}, "
-                           f"{item['price']}, {item['service_date'].strftime('%m/%d/%Y')}\n")
+                damaged_items.append(InventoryItem(
+                    item_id,
+                    details['manufacturer'],
+                    details['item_type'],
+                    self.price_data[item_id],
+                    self.service_date_data[item_id],
+                    details['damaged']
+                ))
+
+        damaged_items = sorted(damaged_items, key=attrgetter('price'), reverse=True)
+
+        lines = [f"{item.item_id}, {item.manufacturer}, {item.item_type}, "
+                 f"{item.price}, {format_service_date(item.service_date)}\n"
+                 for item in damaged_items]
+        write_report(output_file, lines)
+
+    def _build_query_arrays(self):
+        """Build the column arrays and lookup sets used by query_inventory"""
+        self.fill_missing_data()
+        self.ids = list(self.manufacturer_data)
+        details = list(self.manufacturer_data.values())
+        self.manufacturers = [d['manufacturer'] for d in details]
+        self.item_types = [d['item_type'] for d in details]
+        self.manufacturers_lc = [d['manufacturer_lc'] for d in details]
+        self.item_types_lc = [d['item_type_lc'] for d in details]
+        self.prices = [self.price_data[item_id] for item_id in self.ids]
+        self.service_dates = [self.service_date_data[item_id] for item_id in self.ids]
+        self.damaged = [bool(d['damaged']) for d in details]
+
+        self._by_mfr_type = {}
+        self._by_type = {}
+        for i, (manufacturer, item_type) in enumerate(zip(self.manufacturers_lc, self.item_types_lc)):
+            self._by_mfr_type.setdefault((manufacturer, item_type), []).append(i)
+            self._by_type.setdefault(item_type, []).append(i)
+
+        # Most expensive first, so a query's pick is the first available entry.
+        # The sort is stable, so equal prices stay in input order.
+        for indices in self._by_mfr_type.values():
+            indices.sort(key=self.prices.__getitem__, reverse=True)
+
+        # Valid query words, fixed for the whole session
+        self._manufacturers_set = frozenset(manufacturer for manufacturer, _ in self._by_mfr_type)
+        self._types_set = frozenset(self._by_type)
+
+    def _is_available(self, i, today):
+        """Check that item i is undamaged and not past its service date"""
+        return not self.damaged[i] and self.service_dates[i] >= today
+
+    def _format_query_item(self, i):
+        """Format item i the way query_inventory prints it"""
+        return f"{self.ids[i]}, {self.manufacturers[i]}, {self.item_types[i]}, {self.prices[i]}"
 
     def query_inventory(self):
         """User query functionality to search inventory"""
         print("\nWelcome to the Inventory Query System! (Enter 'q' to quit)\n")
         today = datetime.date.today()
+        self._build_query_arrays()
 
         while True:
             user_input = input("Please enter manufacturer and item type: ").strip().lower()
@@ -141,15 +186,10 @@ class Inventory:
                 break
 
             words = user_input.split()
-            found_items = []
-
-            # Identify valid manufacturers and item types
-            manufacturers = {details['manufacturer'].lower() for details in self.manufacturer_data.values()}
-            item_types = {details['item_type'].lower() for details in self.manufacturer_data.values()}
 
             # Extract manufacturer and item type from user input
-            input_manufacturers = [word for word in words if word in manufacturers]
-            input_item_types = [word for word in words if word in item_types]
+            input_manufacturers = [word for word in words if word in self._manufacturers_set]
+            input_item_types = [word for word in words if word in self._types_set]
 
             # Validation: must be exactly 1 manufacturer and 1 item type
             if len(input_manufacturers) != 1 or len(input_item_types) != 1:
@@ -159,49 +199,24 @@ class Inventory:
             manufacturer = input_manufacturers[0]
             item_type = input_item_types[0]
 
-            # Find matching items
-            for item_id, details in self.manufacturer_data.items():
-                if (details['manufacturer'].lower() == manufacturer and
-                        details['item_type'].lower() == item_type and
-                        not details['damaged']):
-                    service_date = self.service_date_data.get(item_id, today)
-                    if service_date >= today:
-                        found_items.append({
-                            'item_id': item_id,
-                            'manufacturer': details['manufacturer'],
-                            'item_type': details['item_type'],
-                            'price': self.price_data.get(item_id, 0)
-                        })
-
-            if not found_items:
+            # Select the most expensive matching item; the bucket is sorted by price,
+            # so the scan stops at the first available item
+            found_items = (i for i in self._by_mfr_type.get((manufacturer, item_type), ())
+                           if self._is_available(i, today))
+            selected = next(found_items, None)
+            if selected is None:
                 print("No such item in inventory\n")
                 continue
 
-            # Select the most expensive item
-            selected_item = max(found_items, key=lambda x: x['price'])
-            print(f"Your item is: {selected_item['item_id']}, {selected_item['manufacturer']}, "
-                  f"{selected_item['item_type']}, {selected_item['price']}")
-
-            # Find alternative item (different manufacturer but same item type)
-            alternatives = []
-            for item_id, details in self.manufacturer_data.items():
-                if (details['item_type'].lower() == item_type and
-                        details['manufacturer'].lower() != manufacturer and
-                        not details['damaged']):
-                    service_date = self.service_date_data.get(item_id, today)
-                    if service_date >= today:
-                        alternatives.append({
-                            'item_id': item_id,
-                            'manufacturer': details['manufacturer'],
-                            'item_type': details['item_type'],
-                            'price': self.price_data.get(item_id, 0)
-                        })
-
-            if alternatives:
-                # Find closest price alternative
-                alt_item = min(alternatives, key=lambda x: abs(x['price'] - selected_item['price']))
-                print(f"You may, also, consider: {alt_item['item_id']}, {alt_item['manufacturer']}, "
-                      f"{alt_item['item_type']}, {alt_item['price']}")
+            print(f"Your item is: {self._format_query_item(selected)}")
+
+            # Find closest price alternative (different manufacturer but same item type)
+            target_price = self.prices[selected]
+            alternatives = (i for i in self._by_type[item_type]
+                            if self.manufacturers_lc[i] != manufacturer and self._is_available(i, today))
+            alt = min(alternatives, key=lambda i: abs(self.prices[i] - target_price), default=None)
+            if alt is not None:
+                print(f"You may, also, consider: {self._format_query_item(alt)}")
             print()
 
 # --- Main Execution ---